@@ -1 +1,2 @@
+from .agent import app as app
 from .agent import root_agent as root_agent
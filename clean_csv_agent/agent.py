@@ -1,10 +1,17 @@
+import asyncio
+import hashlib
+import json
 import os
+from typing import Any, Dict
 
-from dotenv import load_dotenv
 from google.adk.agents import Agent
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
+from google.adk.tools import ToolContext
 from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools.function_tool import FunctionTool
 
+from clean_csv_agent.config import get_config
 from clean_csv_agent.prompts import (
     AUDITOR_PROMPT,
     COORDINATOR_PROMPT,
@@ -13,14 +20,11 @@ from clean_csv_agent.prompts import (
 )
 from clean_csv_agent.src import tools
 
-load_dotenv()
-
 # ---------------------------------------------------------------------------
 # Model Configuration
 # ---------------------------------------------------------------------------
 
-DEFAULT_MODEL_FALLBACK = "gemini-3-flash-preview"
-DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", DEFAULT_MODEL_FALLBACK)
+config = get_config()
 
 # ---------------------------------------------------------------------------
 # Specialized Agents (The "Workers") - Return raw findings
@@ -32,7 +36,7 @@ profiler_agent = Agent(
         "Analyzes CSV structure and schema. Returns column types, statistics, "
         "and type coercion recommendations for all columns in one call."
     ),
-    model=os.getenv("PROFILER_MODEL", DEFAULT_MODEL),
+    model=config.profiler_model,
     instruction=PROFILER_PROMPT,
     tools=[
         FunctionTool(func=tools.profile_all_columns),
@@ -45,7 +49,7 @@ auditor_agent = Agent(
         "Audits data quality issues. Detects type pollution, statistical outliers, "
         "and mixed date formats for all columns in one call."
     ),
-    model=os.getenv("AUDITOR_MODEL", DEFAULT_MODEL),
+    model=config.auditor_model,
     instruction=AUDITOR_PROMPT,
     tools=[
         FunctionTool(func=tools.audit_all_columns),
@@ -58,13 +62,130 @@ pattern_agent = Agent(
         "Identifies consistency issues and patterns. Analyzes casing inconsistencies, "
         "whitespace issues, and missing value patterns for all columns in one call."
     ),
-    model=os.getenv("PATTERN_EXPERT_MODEL", DEFAULT_MODEL),
+    model=config.pattern_expert_model,
     instruction=PATTERN_PROMPT,
     tools=[
         FunctionTool(func=tools.analyze_all_patterns),
     ],
 )
 
+# Cap on how many worker agents (and so Gemini calls) run at the same time.
+ANALYZER_CONCURRENCY = 3
+
+# Worker findings keyed by table fingerprint, agent name and a hash of the
+# worker's model and prompt, so changing WORKER_MODEL or a prompt never serves
+# the previous configuration's findings. Otherwise the findings only depend on
+# the table contents, so analyzing the same file again (a new session, the
+# user asking twice, or a retry after a failed cleaning run) skips the worker
+# LLM calls entirely. Entries are also checkpointed to
+# config.analysis_cache_dir so they survive a server restart; both tiers keep
+# at most ANALYSIS_CACHE_SIZE entries and evict the oldest first.
+ANALYSIS_CACHE_SIZE = 64
+_analysis_cache: Dict[str, Any] = {}
+
+
+def _load_findings(key: str) -> Any:
+    """Return cached findings for *key* from memory or disk, or None."""
+    if key in _analysis_cache:
+        return _analysis_cache[key]
+    try:
+        with open(os.path.join(config.analysis_cache_dir, f"{key}.json")) as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+    _remember_findings(key, result, persist=False)
+    return result
+
+
+def _remember_findings(key: str, result: Any, persist: bool = True) -> None:
+    """Cache findings in memory and, best effort, checkpoint them to disk."""
+    if len(_analysis_cache) >= ANALYSIS_CACHE_SIZE:
+        _analysis_cache.pop(next(iter(_analysis_cache)))
+    _analysis_cache[key] = result
+    if not persist:
+        return
+    path = os.path.join(config.analysis_cache_dir, f"{key}.json")
+    try:
+        os.makedirs(config.analysis_cache_dir, exist_ok=True)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(result, f, default=str)
+        os.replace(f"{path}.tmp", path)
+        _evict_checkpoints()
+    except OSError:
+        pass  # The in-memory entry still serves this process
+
+
+def _evict_checkpoints() -> None:
+    """Delete the oldest checkpoint files beyond ANALYSIS_CACHE_SIZE."""
+    with os.scandir(config.analysis_cache_dir) as entries:
+        files = [e for e in entries if e.is_file() and e.name.endswith(".json")]
+    files.sort(key=lambda e: e.stat().st_mtime)
+    for entry in files[:-ANALYSIS_CACHE_SIZE]:
+        os.remove(entry.path)
+
+
+_analyzer_tools = [
+    AgentTool(agent=profiler_agent),
+    AgentTool(agent=auditor_agent),
+    AgentTool(agent=pattern_agent),
+]
+
+
+async def run_all_analyzers(tool_context: ToolContext) -> Dict[str, Any]:
+    """Runs the Profiler, Auditor, and PatternExpert agents concurrently.
+
+    The three workers are independent, so they are awaited together and the
+    call takes as long as the slowest one rather than the sum of all three.
+    Call once after build_table_profile. Findings for a file and table state
+    that were already analyzed are returned from cache.
+
+    A quick health check runs first. When it finds none of the issues the
+    Auditor and PatternExpert look for, the worker agents are skipped and only
+    the Profiler's schema and type suggestions are returned, computed directly.
+
+    Returns:
+        Raw findings keyed by agent name, or the clean health check and schema.
+    """
+    health = tools.quick_health_check(tool_context)
+    if health["clean"]:
+        return {
+            "clean": True,
+            "health_check": health,
+            "Profiler": tools.profile_all_columns(tool_context),
+        }
+
+    fingerprint = tools.table_fingerprint(tool_context)
+    semaphore = asyncio.Semaphore(ANALYZER_CONCURRENCY)
+
+    async def run(agent_tool: AgentTool) -> Any:
+        # Model names may contain "/", so they are hashed with the prompt
+        # rather than used verbatim in the checkpoint file name.
+        worker = agent_tool.agent
+        setup = f"{worker.model}\n{worker.instruction}".encode()
+        key = f"{fingerprint}_{agent_tool.name}_{hashlib.sha256(setup).hexdigest()[:12]}"
+        cached = _load_findings(key)
+        if cached is not None:
+            return cached
+        # Each worker's batch tool sets this flag when it returns normally, so
+        # a reply that only relays a tool failure is never cached.
+        done_key = f"analysis_done:{agent_tool.agent.tools[0].name}"
+        tool_context.state[done_key] = False
+        async with semaphore:
+            try:
+                result = await agent_tool.run_async(
+                    args={"request": "Analyze every column of the loaded table."},
+                    tool_context=tool_context,
+                )
+            except Exception as e:
+                return {"error": f"{agent_tool.name} failed: {e}"}
+        if result and tool_context.state.get(done_key):
+            _remember_findings(key, result)
+        return result
+
+    results = await asyncio.gather(*(run(t) for t in _analyzer_tools))
+    return {t.name: result for t, result in zip(_analyzer_tools, results)}
+
+
 # ---------------------------------------------------------------------------
 # Coordinator Agent (The "Interface")
 # ---------------------------------------------------------------------------
@@ -76,13 +197,12 @@ root_agent = Agent(
         "(column overflow, era designations), coordinates specialized agents "
         "for profiling and auditing, then proposes and executes cleaning plans."
     ),
-    model=os.getenv("COORDINATOR_MODEL", DEFAULT_MODEL),
+    model=config.coordinator_model,
     instruction=COORDINATOR_PROMPT,
     tools=[
-        AgentTool(agent=profiler_agent),
-        AgentTool(agent=auditor_agent),
-        AgentTool(agent=pattern_agent),
+        FunctionTool(func=run_all_analyzers),
         FunctionTool(func=tools.load_csv),
+        FunctionTool(func=tools.build_table_profile),
         FunctionTool(func=tools.inspect_raw_file),
         FunctionTool(func=tools.detect_era_in_years),
         FunctionTool(func=tools.extract_era_column),
@@ -90,5 +210,30 @@ root_agent = Agent(
         FunctionTool(func=tools.execute_cleaning_plan),
         FunctionTool(func=tools.validate_cleaned_data),
         FunctionTool(func=tools.query_data),
+        FunctionTool(func=tools.lookup_duckdb_reference),
     ],
 )
+
+
+# ---------------------------------------------------------------------------
+# App
+# ---------------------------------------------------------------------------
+
+# The coordinator's instruction (workflow, report format and the DuckDB SQL
+# rules) and its tool declarations are the same on every turn, so they are
+# cached on the Gemini side instead of being re-processed with each message.
+# Per-topic SQL syntax is no longer inlined; the model fetches it with the
+# lookup_duckdb_reference tool. That leaves the instruction at roughly
+# 2.5k-3.5k tokens, so min_tokens sits below it (and above Gemini's minimum
+# cacheable size) for the static prefix to be cached from the first turn.
+CONTEXT_CACHE_CONFIG = ContextCacheConfig(
+    min_tokens=2048,
+    ttl_seconds=3600,
+    cache_intervals=10,
+)
+
+app = App(
+    root_agent=root_agent,
+    name="clean_csv_agent",
+    context_cache_config=CONTEXT_CACHE_CONFIG,
+)
@@ -0,0 +1,56 @@
+"""Runtime configuration for the clean_csv_agent system."""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+DEFAULT_MODEL_FALLBACK = "gemini-3-flash-preview"
+
+# The workers only call one batch tool and return its raw output, so they run
+# on a cheaper, faster tier. The coordinator, which writes the report, stays
+# on the default model.
+WORKER_MODEL_FALLBACK = "gemini-2.5-flash-lite"
+
+ANALYSIS_CACHE_DIR_FALLBACK = os.path.join(
+    os.path.expanduser("~"), ".cache", "clean_csv_agent", "analysis"
+)
+
+
+@dataclass(frozen=True)
+class Config:
+    """Model selection and cache location, resolved once per process."""
+
+    default_model: str
+    worker_model: str
+    coordinator_model: str
+    profiler_model: str
+    auditor_model: str
+    pattern_expert_model: str
+    analysis_cache_dir: str
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, reading .env only if credentials are unset.
+
+    Containers and the ADK CLI already provide the environment, so the .env
+    lookup is skipped when Gemini or Vertex AI credentials are present.
+    """
+    if not (os.getenv("GOOGLE_API_KEY") or os.getenv("GOOGLE_CLOUD_PROJECT")):
+        load_dotenv(override=False)
+
+    default_model = os.getenv("DEFAULT_MODEL", DEFAULT_MODEL_FALLBACK)
+    worker_model = os.getenv("WORKER_MODEL", WORKER_MODEL_FALLBACK)
+    return Config(
+        default_model=default_model,
+        worker_model=worker_model,
+        coordinator_model=os.getenv("COORDINATOR_MODEL", default_model),
+        profiler_model=os.getenv("PROFILER_MODEL", worker_model),
+        auditor_model=os.getenv("AUDITOR_MODEL", worker_model),
+        pattern_expert_model=os.getenv("PATTERN_EXPERT_MODEL", worker_model),
+        analysis_cache_dir=os.path.expanduser(
+            os.getenv("ANALYSIS_CACHE_DIR", ANALYSIS_CACHE_DIR_FALLBACK)
+        ),
+    )
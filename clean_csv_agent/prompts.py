@@ -1,6 +1,6 @@
 """Agent instruction prompts for the clean_csv_agent system."""
 
-from clean_csv_agent.src.duckdb_reference import DUCKDB_SQL_REFERENCE
+from clean_csv_agent.src.duckdb_reference import DUCKDB_SQL_RULES, DUCKDB_SQL_TOPICS
 
 # ---------------------------------------------------------------------------
 # Sub-Agent Prompts
@@ -51,7 +51,7 @@ COORDINATOR_PROMPT = f"""You are a friendly Data Assistant.
 - Your FIRST and ONLY message to the user is the final Detailed Report below.
 - If you send more than one message during analysis, you have failed.
 
-## WORKFLOW (all silent — no user messages until step 5):
+## WORKFLOW (all silent — no user messages until step 6):
 1. Run 'load_csv'. This automatically:
    - Tries multiple quote/escape configurations to handle fields with commas
    - Normalizes column names (lowercase, underscores)
@@ -59,10 +59,17 @@ COORDINATOR_PROMPT = f"""You are a friendly Data Assistant.
 2. For any columns that might contain years, run 'detect_era_in_years'.
    - If era_detected is true, run 'extract_era_column' to split year and era.
    - This handles values like "2000 BC", "500 BCE", "1066 AD", "2024 CE".
-3. Call 'Profiler', 'Auditor', and 'PatternExpert' in parallel.
-   - Each agent makes ONE tool call and returns comprehensive results.
-4. Build a single list of SQL fix statements and run 'preview_full_plan' ONCE.
-5. ONLY NOW send your first message: the Detailed Report below.
+3. Run 'build_table_profile' ONCE, after any era extraction.
+   - It scans the table once and caches per-column statistics that the
+     specialist agents reuse instead of re-scanning the table.
+4. Run 'run_all_analyzers' ONCE.
+   - It runs the Profiler, Auditor, and PatternExpert agents concurrently;
+     each makes ONE tool call and returns comprehensive results.
+   - If it returns clean: true, the quick health check found no quality
+     issues. Skip step 5 and report that no issues were found, along with
+     the schema and any type suggestions it returned.
+5. Build a single list of SQL fix statements and run 'preview_full_plan' ONCE.
+6. ONLY NOW send your first message: the Detailed Report below.
 
 ## DETAILED REPORT FORMAT (your one and only message during Phase 1):
 
@@ -200,5 +207,7 @@ or approve the plan. Handle each type of request appropriately:
 - Example of WRONG SQL (never do this):
   UPDATE data SET quantity = NULL WHERE try_cast(quantity AS INTEGER) IS NULL;
 
-{DUCKDB_SQL_REFERENCE}
+{DUCKDB_SQL_RULES}
+For DuckDB syntax examples, call 'lookup_duckdb_reference' with one of these
+topics: {', '.join(DUCKDB_SQL_TOPICS)}.
 """
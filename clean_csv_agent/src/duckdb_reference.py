@@ -1,5 +1,8 @@
-DUCKDB_SQL_REFERENCE = """
-## DuckDB SQL Reference for Data Cleaning
+# Rules that apply to every cleaning statement. These stay in the coordinator
+# prompt; the per-topic syntax examples below are fetched on demand with the
+# lookup_duckdb_reference tool.
+DUCKDB_SQL_RULES = """
+## DuckDB SQL Rules for Data Cleaning
 
 NEVER use DELETE or DROP TABLE. Every row in the original data MUST be preserved.
 To handle bad values, UPDATE them (e.g. SET to NULL). To handle duplicates, flag
@@ -10,11 +13,28 @@ in cleaning statements — the data is already loaded into `data`.
 
 For querying (query_data tool), use the table name returned by load_csv.
 
+### IMPORTANT DuckDB-specific notes
+- DuckDB uses `DOUBLE` not `FLOAT8` or `REAL` for double-precision floats.
+- `VARCHAR` is the string type (not `TEXT` or `STRING`).
+- `BOOLEAN` is a native type. Strings like 'true'/'false' auto-cast.
+- Column names with spaces or special characters MUST be double-quoted: "my column".
+- DuckDB supports `STRPTIME` (string→timestamp) and `STRFTIME` (timestamp→string).
+- There is no `SAFE_CAST` — use `TRY_CAST` instead.
+- `ALTER COLUMN ... SET DATA TYPE` will fail if existing values can't be cast.
+  Always clean bad values first, then alter the type.
+- `rowid` is a built-in pseudo-column for identifying rows.
+- String concatenation uses `||` operator: `col1 || ' ' || col2`.
+- Use `EPOCH` to extract unix timestamp: `EPOCH(timestamp_col)`.
+"""
+
+DUCKDB_SQL_TOPICS = {
+    "update": """
 ### UPDATE rows
 ```sql
 UPDATE data SET column_name = <expression> WHERE <condition>;
 ```
-
+""",
+    "alter_table": """
 ### ALTER TABLE
 ```sql
 -- Rename a column
@@ -29,7 +49,8 @@ ALTER TABLE data ADD COLUMN column_name data_type;
 -- Drop a column
 ALTER TABLE data DROP COLUMN column_name;
 ```
-
+""",
+    "type_casting": """
 ### Type Casting
 DuckDB uses `CAST` and `TRY_CAST`. Use TRY_CAST when values may fail — it
 returns NULL instead of erroring.
@@ -46,7 +67,8 @@ TRY_CAST(column_name AS INTEGER)
 TRY_CAST(column_name AS DATE)
 TRY_CAST(column_name AS TIMESTAMP)
 ```
-
+""",
+    "type_coercion": """
 ### Cleaning type-polluted columns and type coercion
 When a column has mixed types (e.g. numbers + junk strings), clean it in two
 steps: first UPDATE the bad values, then ALTER the type.
@@ -65,7 +87,8 @@ ALTER TABLE data ALTER COLUMN age TYPE INTEGER USING TRY_CAST(age AS INTEGER);
 -- For date columns:
 ALTER TABLE data ALTER COLUMN date_col TYPE DATE USING TRY_CAST(date_col AS DATE);
 ```
-
+""",
+    "null_handling": """
 ### NULL handling
 ```sql
 -- Replace NULLs with a default
@@ -81,7 +104,8 @@ WHERE LOWER(TRIM(column_name)) IN (
 -- NULLIF: returns NULL if the two expressions are equal
 UPDATE data SET column_name = NULLIF(column_name, '');
 ```
-
+""",
+    "string_functions": """
 ### String functions
 ```sql
 -- Trim whitespace
@@ -105,7 +129,8 @@ SUBSTRING(column_name, start, length)
 -- OR
 column_name[start:end]
 ```
-
+""",
+    "casing": """
 ### Casing normalization
 ```sql
 -- Title Case for long strings, UPPER for short codes (state abbrevs, etc.)
@@ -121,7 +146,8 @@ UPDATE data SET city = CASE
 END
 WHERE city IS NOT NULL;
 ```
-
+""",
+    "numeric": """
 ### Numeric cleaning
 ```sql
 -- Clamp outliers to a range
@@ -133,7 +159,8 @@ UPDATE data SET price = ROUND(price, 2);
 -- Absolute value
 UPDATE data SET value = ABS(value);
 ```
-
+""",
+    "date_parsing": """
 ### Date and timestamp parsing
 DuckDB auto-detects many date formats with TRY_CAST. For non-standard formats
 use TRY_STRPTIME (safe) or STRPTIME (errors on failure):
@@ -165,7 +192,8 @@ STRFTIME(date_col, '%Y-%m-%d')
 -- %H = hour (24h), %M = minute, %S = second
 -- %y = 2-digit year, %b = abbreviated month name, %B = full month name
 ```
-
+""",
+    "deduplication": """
 ### Deduplication
 To flag duplicates, add a boolean column instead of deleting rows:
 ```sql
@@ -177,7 +205,8 @@ WHERE rowid NOT IN (
     GROUP BY col1, col2, col3
 );
 ```
-
+""",
+    "case_when": """
 ### Conditional updates
 ```sql
 -- CASE expressions
@@ -188,7 +217,8 @@ SET category = CASE
     ELSE 'low'
 END;
 ```
-
+""",
+    "booleans": """
 ### Boolean normalization
 ```sql
 -- Convert various boolean representations to proper BOOLEAN
@@ -199,7 +229,8 @@ SET is_active = CASE
     ELSE NULL
 END;
 ```
-
+""",
+    "column_names": """
 ### Column Name Normalization
 Column names are automatically normalized to lowercase snake_case when loaded
 (via `normalize_names=true`). For example:
@@ -207,19 +238,7 @@ Column names are automatically normalized to lowercase snake_case when loaded
 - "OrderID" → "order_id"
 - "Total Amount ($)" → "total_amount____"
 
-Always use the **normalized** column names in your SQL. Run `get_smart_schema`
-to see the actual column names after normalization.
-
-### IMPORTANT DuckDB-specific notes
-- DuckDB uses `DOUBLE` not `FLOAT8` or `REAL` for double-precision floats.
-- `VARCHAR` is the string type (not `TEXT` or `STRING`).
-- `BOOLEAN` is a native type. Strings like 'true'/'false' auto-cast.
-- Column names with spaces or special characters MUST be double-quoted: "my column".
-- DuckDB supports `STRPTIME` (string→timestamp) and `STRFTIME` (timestamp→string).
-- There is no `SAFE_CAST` — use `TRY_CAST` instead.
-- `ALTER COLUMN ... SET DATA TYPE` will fail if existing values can't be cast.
-  Always clean bad values first, then alter the type.
-- `rowid` is a built-in pseudo-column for identifying rows.
-- String concatenation uses `||` operator: `col1 || ' ' || col2`.
-- Use `EPOCH` to extract unix timestamp: `EPOCH(timestamp_col)`.
-"""
+Always use the **normalized** column names in your SQL. The schema returned by
+`load_csv` lists the actual column names after normalization.
+""",
+}
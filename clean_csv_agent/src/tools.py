@@ -1,13 +1,16 @@
+import hashlib
+import json
 import os
 import re as _re
 import tempfile
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import duckdb
 import polars as pl
 from google.adk.tools import ToolContext
 
 from clean_csv_agent.src.datagrunt import CSVReader, DuckDBQueries
+from clean_csv_agent.src.duckdb_reference import DUCKDB_SQL_TOPICS
 
 
 # ---------------------------------------------------------------------------
@@ -35,6 +38,9 @@ def _validate_path(path: str) -> str:
 # Module-level cache for CSVReader instances (keyed by file path)
 _readers: Dict[str, CSVReader] = {}
 
+# sha256 of each source file, keyed by path and valid for one (mtime, size)
+_file_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
 
 def _get_reader(tool_context: ToolContext) -> CSVReader:
     """Retrieve or create a CSVReader for the current session's CSV file."""
@@ -84,6 +90,10 @@ _DESTRUCTIVE_PATTERN = _re.compile(
 )
 
 
+# A single statement that starts with SELECT can't change the table
+_READ_ONLY_PATTERN = _re.compile(r"^\s*SELECT\b[^;]*;?\s*$", _re.IGNORECASE | _re.DOTALL)
+
+
 def _reject_destructive(sql: str) -> Dict[str, Any] | None:
     """Return an error dict if the SQL would remove rows, else None."""
     if _DESTRUCTIVE_PATTERN.search(sql):
@@ -265,6 +275,7 @@ def load_csv(
 
     # Store path early so inspect_raw_file can use it if we fail
     tool_context.state["csv_path"] = file_path
+    tool_context.state["profile"] = None
 
     # Count source lines (minus header) for verification
     source_line_count = 0
@@ -643,6 +654,10 @@ def query_data(sql: str, tool_context: ToolContext) -> Dict[str, Any]:
 
     columns = _get_column_names(table)
 
+    # Anything but a plain SELECT may change the data the profile describes
+    if not _READ_ONLY_PATTERN.match(sql):
+        tool_context.state["profile"] = None
+
     try:
         result = _run_sql_safe(sql, table)
     except Exception as e:
@@ -664,6 +679,26 @@ def query_data(sql: str, tool_context: ToolContext) -> Dict[str, Any]:
     }
 
 
+def lookup_duckdb_reference(topic: str) -> Dict[str, Any]:
+    """Returns DuckDB syntax examples for one data-cleaning topic.
+
+    Call this when you need DuckDB syntax help before writing cleaning SQL.
+
+    Args:
+        topic: Reference topic, e.g. 'case_when', 'date_parsing', 'null_handling'.
+
+    Returns:
+        The reference text for the topic, or the list of available topics.
+    """
+    key = topic.strip().lower().replace(" ", "_")
+    if key not in DUCKDB_SQL_TOPICS:
+        return {
+            "error": f"Unknown topic '{topic}'.",
+            "available_topics": list(DUCKDB_SQL_TOPICS),
+        }
+    return {"topic": key, "reference": DUCKDB_SQL_TOPICS[key]}
+
+
 def preview_full_plan(sql_statements: List[str], tool_context: ToolContext) -> Dict[str, Any]:
     """Shows the cumulative impact of all proposed cleaning steps in one view.
 
@@ -880,6 +915,8 @@ def execute_cleaning_plan(
     if old_path in _readers:
         del _readers[old_path]
     tool_context.state["csv_path"] = cleaned_path
+    # Re-cleaning a cleaned file keeps the same table name
+    tool_context.state["profile"] = None
 
     sample = duckdb.sql("SELECT * FROM data LIMIT 5").pl()
 
@@ -896,6 +933,193 @@ def execute_cleaning_plan(
 # Batch Tools (for parallel processing optimization)
 # ---------------------------------------------------------------------------
 
+def build_table_profile(tool_context: ToolContext) -> Dict[str, Any]:
+    """Profiles every column of the loaded table in a single scan.
+
+    Collects each column's type, non-null count, distinct count, and min/max
+    values, and caches the result in session state so the Profiler, Auditor,
+    and PatternExpert reuse it instead of re-scanning the table. Call once
+    after load_csv (and any era extraction), before the specialist agents.
+
+    Returns:
+        Table name, row count, and per-column statistics.
+    """
+    reader = _get_reader(tool_context)
+    table = reader.db_table
+    _ensure_table(reader)
+
+    col_types = {row[0]: row[1] for row in duckdb.sql(f"DESCRIBE {table}").fetchall()}
+    select_list = ["COUNT(*)"]
+    for col in col_types:
+        select_list += [
+            f'COUNT("{col}")',
+            f'COUNT(DISTINCT "{col}")',
+            f'CAST(MIN("{col}") AS VARCHAR)',
+            f'CAST(MAX("{col}") AS VARCHAR)',
+        ]
+    row = duckdb.sql(f"SELECT {', '.join(select_list)} FROM {table}").fetchone()
+
+    total_rows = row[0]
+    profile_columns = {}
+    for i, (col, col_type) in enumerate(col_types.items()):
+        non_null, distinct, min_value, max_value = row[1 + 4 * i:5 + 4 * i]
+        profile_columns[col] = {
+            "type": col_type,
+            "non_null": non_null,
+            "distinct": distinct,
+            "min": min_value,
+            "max": max_value,
+        }
+
+    profile = {
+        "table": table,
+        "total_rows": total_rows,
+        "columns": profile_columns,
+    }
+    tool_context.state["profile"] = profile
+    return profile
+
+
+def _mark_analysis_done(tool_context: ToolContext, tool_name: str) -> None:
+    """Record that a batch analysis tool returned normally in this run."""
+    tool_context.state[f"analysis_done:{tool_name}"] = True
+
+
+def _get_profile(tool_context: ToolContext, table: str) -> Dict[str, Any]:
+    """Return the cached profile for *table*, building it if missing or stale."""
+    profile = tool_context.state.get("profile")
+    if not profile or profile.get("table") != table:
+        profile = build_table_profile(tool_context)
+    return profile
+
+
+def table_fingerprint(tool_context: ToolContext) -> str:
+    """Return a digest identifying the loaded file and the table's current state.
+
+    Not an agent tool. Hashes the CSV's bytes, the table profile and an
+    order-independent hash of every row, so the fingerprint changes when the
+    file does, when a structural fix (era extraction, renames, overflow
+    repair) changes the table, and when query_data edits values in place.
+    """
+    reader = _get_reader(tool_context)
+    table = reader.db_table
+    profile = _get_profile(tool_context, table)
+    rows_hash = duckdb.sql(f"SELECT bit_xor(hash(t)) FROM {table} AS t").fetchone()[0]
+    digest = hashlib.sha256(_file_digest(reader.filepath).encode())
+    digest.update(json.dumps(profile, sort_keys=True, default=str).encode())
+    digest.update(str(rows_hash).encode())
+    return digest.hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    """Return the sha256 of *path*, re-reading the file only when it changed."""
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_digests.get(path)
+    if cached and cached[0] == version:
+        return cached[1]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    _file_digests[path] = (version, digest.hexdigest())
+    return digest.hexdigest()
+
+
+_MISSING_TOKENS = "('n/a', 'na', 'null', 'none', '-', '--', 'unknown', '')"
+_DATE_FORMATS = ['%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d', '%Y/%m/%d']
+
+
+def quick_health_check(tool_context: ToolContext) -> Dict[str, Any]:
+    """Cheaply checks whether the loaded table has any issue the specialists report.
+
+    Not an agent tool; run_all_analyzers calls it first and skips the worker
+    agents when the table is clean. Counts, in two scans, the signals behind
+    each specialist finding: numeric columns polluted by text, case variants,
+    untrimmed whitespace, missing-value tokens, mixed date formats, and IQR
+    outliers.
+
+    Returns:
+        {"clean": bool, "signals": {...}} with per-signal column counts.
+    """
+    reader = _get_reader(tool_context)
+    table = reader.db_table
+    _ensure_table(reader)
+    profile = _get_profile(tool_context, table)
+    columns = profile["columns"]
+    text_cols = [
+        col for col, stats in columns.items()
+        if "CHAR" in stats["type"].upper() or "TEXT" in stats["type"].upper()
+    ]
+
+    select_list = []
+    for col in columns:
+        as_double = f'TRY_CAST("{col}" AS DOUBLE)'
+        select_list += [
+            f"approx_quantile({as_double}, 0.25)",
+            f"approx_quantile({as_double}, 0.75)",
+        ]
+    for col in text_cols:
+        select_list += [
+            f'COUNT(TRY_CAST("{col}" AS DOUBLE))',
+            f'COUNT(DISTINCT LOWER("{col}"))',
+            f'COUNT(*) FILTER (WHERE "{col}" != TRIM("{col}") OR "{col}" LIKE \'%  %\')',
+            f'COUNT(*) FILTER (WHERE LOWER(TRIM("{col}")) IN {_MISSING_TOKENS})',
+        ] + [
+            f"COUNT(try_strptime(\"{col}\", '{fmt}'))" for fmt in _DATE_FORMATS
+        ]
+    row = duckdb.sql(f"SELECT {', '.join(select_list)} FROM {table}").fetchone()
+
+    quartiles = dict(zip(columns, zip(row[0:2 * len(columns):2], row[1:2 * len(columns):2])))
+    fences = {
+        col: (q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+        for col, (q1, q3) in quartiles.items()
+        if q1 is not None and q3 is not None and q3 > q1
+    }
+    outlier_columns = []
+    if fences:
+        outlier_counts = duckdb.sql(f"""
+            SELECT {', '.join(
+                f'COUNT(*) FILTER (WHERE TRY_CAST("{col}" AS DOUBLE) NOT BETWEEN {lo} AND {hi})'
+                for col, (lo, hi) in fences.items()
+            )}
+            FROM {table}
+        """).fetchone()
+        outlier_columns = [col for col, n in zip(fences, outlier_counts) if n]
+
+    signals = {
+        "type_pollution": [],
+        "casing_inconsistencies": [],
+        "whitespace_issues": [],
+        "missing_value_tokens": [],
+        "mixed_date_formats": [],
+        "outliers": outlier_columns,
+    }
+    width = 4 + len(_DATE_FORMATS)
+    offset = 2 * len(columns)
+    for i, col in enumerate(text_cols):
+        start = offset + width * i
+        castable, distinct_lower, whitespace, missing = row[start:start + 4]
+        date_matches = row[start + 4:start + width]
+        if 0 < castable < columns[col]["non_null"]:
+            signals["type_pollution"].append(col)
+        if distinct_lower < columns[col]["distinct"]:
+            signals["casing_inconsistencies"].append(col)
+        if whitespace:
+            signals["whitespace_issues"].append(col)
+        if missing:
+            signals["missing_value_tokens"].append(col)
+        if sum(1 for n in date_matches if n) > 1:
+            signals["mixed_date_formats"].append(col)
+
+    return {
+        "clean": not any(signals.values()),
+        "total_rows": profile["total_rows"],
+        "null_cells": sum(profile["total_rows"] - stats["non_null"] for stats in columns.values()),
+        "signals": signals,
+    }
+
+
 def profile_all_columns(tool_context: ToolContext) -> Dict[str, Any]:
     """Analyzes schema and suggests type coercions for ALL columns in one call.
 
@@ -910,17 +1134,23 @@ def profile_all_columns(tool_context: ToolContext) -> Dict[str, Any]:
     _ensure_table(reader)
 
     total_rows = reader.row_count_without_header
-    columns = _get_column_names(table)
-
-    # Get schema summary
-    schema = duckdb.sql(f"""
-        SELECT
-            column_name,
-            column_type,
-            approx_unique,
-            null_percentage::FLOAT as null_percentage
-        FROM (SUMMARIZE SELECT * FROM {table})
-    """).pl().to_dicts()
+    profile = _get_profile(tool_context, table)
+    columns = list(profile["columns"])
+
+    # Get schema summary from the shared profile
+    profile_rows = profile["total_rows"]
+    schema = [
+        {
+            "column_name": col,
+            "column_type": stats["type"],
+            "approx_unique": stats["distinct"],
+            "null_percentage": (
+                round((profile_rows - stats["non_null"]) / profile_rows * 100, 2)
+                if profile_rows else 0.0
+            ),
+        }
+        for col, stats in profile["columns"].items()
+    ]
 
     # Build type coercion suggestions for all columns in one query batch
     coercion_results = []
@@ -939,7 +1169,7 @@ def profile_all_columns(tool_context: ToolContext) -> Dict[str, Any]:
               OR try_cast(try_strptime("{col}"::VARCHAR, '%m/%d/%Y') AS DATE) IS NOT NULL
         """).fetchone()[0]
 
-        col_total = duckdb.sql(f'SELECT COUNT(*) FROM {table} WHERE "{col}" IS NOT NULL').fetchone()[0]
+        col_total = profile["columns"][col]["non_null"]
 
         suggestions = []
         if col_total > 0:
@@ -954,6 +1184,7 @@ def profile_all_columns(tool_context: ToolContext) -> Dict[str, Any]:
                 "suggested_types": suggestions,
             })
 
+    _mark_analysis_done(tool_context, "profile_all_columns")
     return {
         "total_records": total_rows,
         "total_columns": len(columns),
@@ -976,8 +1207,9 @@ def audit_all_columns(tool_context: ToolContext) -> Dict[str, Any]:
     table = reader.db_table
     _ensure_table(reader)
 
-    columns = _get_column_names(table)
-    total_rows = duckdb.sql(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    profile = _get_profile(tool_context, table)
+    columns = list(profile["columns"])
+    total_rows = profile["total_rows"]
 
     pollution_issues = []
     outlier_issues = []
@@ -1064,6 +1296,7 @@ def audit_all_columns(tool_context: ToolContext) -> Dict[str, Any]:
                 "formats_found": found_formats,
             })
 
+    _mark_analysis_done(tool_context, "audit_all_columns")
     return {
         "total_rows": total_rows,
         "columns_analyzed": len(columns),
@@ -1086,24 +1319,22 @@ def analyze_all_patterns(tool_context: ToolContext) -> Dict[str, Any]:
     table = reader.db_table
     _ensure_table(reader)
 
-    columns = _get_column_names(table)
-    total_rows = duckdb.sql(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    profile = _get_profile(tool_context, table)
+    columns = list(profile["columns"])
+    total_rows = profile["total_rows"]
 
     casing_issues = []
     whitespace_issues = []
     missing_value_patterns = []
 
-    # Get column types to skip non-text columns for string operations
-    col_types = {row[0]: row[1] for row in duckdb.sql(f"DESCRIBE {table}").fetchall()}
-
     for col in columns:
-        col_type = col_types.get(col, "").upper()
+        col_type = profile["columns"][col]["type"].upper()
 
         # Skip boolean and numeric columns for text-based analysis
         is_text_col = "VARCHAR" in col_type or "TEXT" in col_type or "CHAR" in col_type
 
-        # Get unique count to determine if it's a categorical column
-        unique_count = duckdb.sql(f'SELECT COUNT(DISTINCT "{col}") FROM {table}').fetchone()[0]
+        # Unique count from the profile determines if it's a categorical column
+        unique_count = profile["columns"][col]["distinct"]
 
         # Only analyze text columns with reasonable cardinality (likely categorical)
         if is_text_col and unique_count is not None and 1 < unique_count <= 100:
@@ -1181,6 +1412,7 @@ def analyze_all_patterns(tool_context: ToolContext) -> Dict[str, Any]:
             except Exception:
                 pass
 
+    _mark_analysis_done(tool_context, "analyze_all_patterns")
     return {
         "total_rows": total_rows,
         "columns_analyzed": len(columns),
@@ -1453,6 +1685,9 @@ def repair_column_overflow(tool_context: ToolContext) -> Dict[str, Any]:
             if best_result is None or best_result["config"] != config:
                 duckdb.sql(f"DROP TABLE IF EXISTS {table}_test")
 
+    # Either path below rewrites the table, so the cached profile is stale
+    tool_context.state["profile"] = None
+
     # Step 3: Apply the best result
     if best_result and best_overflow_count < original_overflow_count:
         # Normalize column names in the new table
@@ -1558,6 +1793,10 @@ _ERA_PREFIX_PATTERN = _re.compile(
     _re.IGNORECASE
 )
 
+# Every era the patterns above can match contains one of these tokens, so a
+# column without any of them needs no scan in Python
+_ERA_HINT_PATTERN = r'(?i)(BC|AD|CE|B\.C|A\.D|C\.E)'
+
 
 def detect_era_in_years(column: str, tool_context: ToolContext) -> Dict[str, Any]:
     """Detects if a column contains years with era designations (BC, BCE, AD, CE).
@@ -1581,6 +1820,23 @@ def detect_era_in_years(column: str, tool_context: ToolContext) -> Dict[str, Any
     if col_error:
         return col_error
 
+    no_era = {
+        "era_detected": False,
+        "column": column,
+        "message": "No era designations found in this column.",
+    }
+
+    # Most columns hold no era token at all; a single match inside DuckDB
+    # that stops at the first hit rules those out without fetching the column
+    has_era_hint = duckdb.execute(f"""
+        SELECT EXISTS (
+            SELECT 1 FROM {table}
+            WHERE regexp_matches(CAST("{column}" AS VARCHAR), ?)
+        )
+    """, [_ERA_HINT_PATTERN]).fetchone()[0]
+    if not has_era_hint:
+        return no_era
+
     # Get all values from the column
     values = duckdb.sql(f'SELECT "{column}" FROM {table} WHERE "{column}" IS NOT NULL').pl()
 
@@ -1617,11 +1873,7 @@ def detect_era_in_years(column: str, tool_context: ToolContext) -> Dict[str, Any
     era_count = len(era_rows)
 
     if era_count == 0:
-        return {
-            "era_detected": False,
-            "column": column,
-            "message": "No era designations found in this column.",
-        }
+        return no_era
 
     return {
         "era_detected": True,
@@ -1635,6 +1887,11 @@ def detect_era_in_years(column: str, tool_context: ToolContext) -> Dict[str, Any
     }
 
 
+# Era designations after a year ("2000 BC") or before it ("AD 2000")
+_ERA_SUFFIX_RE = r'(?i)(BCE?|B\.C\.E?\.?|CE|AD|A\.D\.?|C\.E\.?)\s*$'
+_ERA_PREFIX_RE = r'(?i)^\s*(BCE?|B\.C\.E?\.?|CE|AD|A\.D\.?|C\.E\.?)\s+'
+
+
 def extract_era_column(column: str, tool_context: ToolContext) -> Dict[str, Any]:
     """Extracts era designations from a year column into a separate 'era' column.
 
@@ -1670,31 +1927,32 @@ def extract_era_column(column: str, tool_context: ToolContext) -> Dict[str, Any]
     before_sample = duckdb.sql(f'SELECT * FROM {table} LIMIT 5').pl()
 
     # Add the era column
+    tool_context.state["profile"] = None
     duckdb.sql(f'ALTER TABLE {table} ADD COLUMN IF NOT EXISTS "{era_col_name}" VARCHAR')
 
     # Extract era exactly as it appears in the data (preserve original text)
-    # Handle suffix patterns (e.g., "2000 BC", "1500 B.C.E.")
-    duckdb.sql(f'''
-        UPDATE {table}
-        SET "{era_col_name}" = TRIM(regexp_extract("{column}", '(?i)(BCE?|B\\.C\\.E?\\.?|CE|AD|A\\.D\\.?|C\\.E\\.?)\\s*$', 1))
-        WHERE "{column}" IS NOT NULL
-          AND regexp_matches("{column}", '(?i)(BCE?|B\\.C\\.E?\\.?|CE|AD|A\\.D\\.?|C\\.E\\.?)\\s*$')
-    ''')
-
-    # Handle prefix patterns (e.g., "AD 2000", "B.C. 500")
+    # from suffix patterns (e.g., "2000 BC", "1500 B.C.E.") or, failing that,
+    # prefix patterns (e.g., "AD 2000", "B.C. 500"), and keep just the numeric
+    # year wherever an era was found. SET expressions all see the old row, so
+    # the year rewrite repeats the era expression; one UPDATE, one pass.
+    era_expr = f'''
+        CASE
+            WHEN regexp_matches("{column}", '{_ERA_SUFFIX_RE}')
+                THEN TRIM(regexp_extract("{column}", '{_ERA_SUFFIX_RE}', 1))
+            WHEN "{era_col_name}" IS NULL
+                 AND regexp_matches("{column}", '{_ERA_PREFIX_RE}\\d')
+                THEN TRIM(regexp_extract("{column}", '{_ERA_PREFIX_RE}', 1))
+            ELSE "{era_col_name}"
+        END
+    '''
     duckdb.sql(f'''
         UPDATE {table}
-        SET "{era_col_name}" = TRIM(regexp_extract("{column}", '(?i)^\\s*(BCE?|B\\.C\\.E?\\.?|CE|AD|A\\.D\\.?|C\\.E\\.?)\\s+', 1))
+        SET "{era_col_name}" = {era_expr},
+            "{column}" = CASE WHEN COALESCE({era_expr}, '') != ''
+                THEN regexp_extract("{column}", '(\\d+)', 1)
+                ELSE "{column}"
+            END
         WHERE "{column}" IS NOT NULL
-          AND "{era_col_name}" IS NULL
-          AND regexp_matches("{column}", '(?i)^\\s*(BCE?|B\\.C\\.E?\\.?|CE|AD|A\\.D\\.?|C\\.E\\.?)\\s+\\d')
-    ''')
-
-    # Extract just the numeric year (only for rows where we found an era)
-    duckdb.sql(f'''
-        UPDATE {table}
-        SET "{column}" = regexp_extract("{column}", '(\\d+)', 1)
-        WHERE "{era_col_name}" IS NOT NULL AND "{era_col_name}" != ''
     ''')
 
     # Get stats
@@ -1784,6 +2042,7 @@ def normalize_column_names(tool_context: ToolContext) -> Dict[str, Any]:
                 seen[new] = 0
 
     # Apply renames
+    tool_context.state["profile"] = None
     for old_name, new_name in renames.items():
         try:
             duckdb.sql(f'ALTER TABLE {table} RENAME COLUMN "{old_name}" TO "{new_name}"')
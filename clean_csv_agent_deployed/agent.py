@@ -16,6 +16,7 @@
 import os
 
 from google.adk.agents import Agent
+from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.apps import App
 from google.adk.models import Gemini
 from google.genai import types
@@ -75,11 +76,30 @@ root_agent = Agent(
         tools.save_cleaned_csv,
         tools.validate_cleaned_data,
         tools.query_data,
+        tools.lookup_duckdb_reference,
     ],
 )
 
 
+# ---------------------------------------------------------------------------
+# App
+# ---------------------------------------------------------------------------
+
+# The coordinator's instruction (workflow, report format and the DuckDB SQL
+# rules) and its tool declarations are the same on every turn, so they are
+# cached on the Gemini side instead of being re-processed with each message.
+# Per-topic SQL syntax is no longer inlined; the model fetches it with the
+# lookup_duckdb_reference tool. That leaves the instruction at roughly
+# 2.5k-3.5k tokens, so min_tokens sits below it (and above Gemini's minimum
+# cacheable size) for the static prefix to be cached from the first turn.
+CONTEXT_CACHE_CONFIG = ContextCacheConfig(
+    min_tokens=2048,
+    ttl_seconds=3600,
+    cache_intervals=10,
+)
+
 app = App(
     root_agent=root_agent,
     name="src",
+    context_cache_config=CONTEXT_CACHE_CONFIG,
 )
@@ -14,6 +14,7 @@
 
 import os
 import re
+from functools import cached_property
 
 import duckdb
 
@@ -26,6 +27,9 @@ class CSVReader:
         self.filepath = filepath
         self.engine = engine
         self._db_table = self._generate_table_name(filepath)
+        # Columns/types/row count of the loaded table, filled lazily by the
+        # tools layer and cleared whenever the table is rebuilt or altered
+        self._meta_cache = None
 
     def _generate_table_name(self, filepath: str) -> str:
         """Generates a safe table name from the filename.
@@ -50,12 +54,12 @@ class CSVReader:
     def db_table(self) -> str:
         return self._db_table
 
-    @property
+    @cached_property
     def row_count_without_header(self) -> int:
-        """Counts rows in the CSV, excluding the header."""
+        """Counts rows in the CSV, excluding the header (computed once)."""
         try:
-            query = f"SELECT COUNT(*) FROM read_csv('{self.filepath}', auto_detect=true, header=true)"
-            return duckdb.sql(query).fetchone()[0]
+            query = "SELECT COUNT(*) FROM read_csv(?, auto_detect=true, header=true)"
+            return duckdb.execute(query, [self.filepath]).fetchone()[0]
         except Exception:
             # Fallback to python line counting if duckdb fails
             with open(self.filepath, 'r', encoding='utf-8', errors='ignore') as f:
@@ -72,6 +76,7 @@ class DuckDBQueries:
     def import_csv_query_normalize_columns(self) -> str:
         """
         Generates a SQL query to import the CSV into a table with normalized column names.
+        The file path is left as a ? placeholder to bind at execution.
         """
         reader = CSVReader(self.filepath)
         table_name = reader.db_table
@@ -79,7 +84,7 @@ class DuckDBQueries:
         return f"""
             CREATE OR REPLACE TABLE {table_name} AS
             SELECT * FROM read_csv(
-                '{self.filepath}',
+                ?,
                 auto_detect=true,
                 normalize_names=true,
                 quote='"',
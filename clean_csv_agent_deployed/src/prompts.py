@@ -14,7 +14,7 @@
 
 """Agent instruction prompts for the clean-csv-agent system."""
 
-from src.duckdb_reference import DUCKDB_SQL_REFERENCE
+from src.duckdb_reference import DUCKDB_SQL_RULES, DUCKDB_SQL_TOPICS
 
 # ---------------------------------------------------------------------------
 # Coordinator Prompt
@@ -65,6 +65,8 @@ If the user pastes a file path instead, pass it to 'load_csv' as the file_path a
    - 'audit_all_columns' (type pollution, outliers, date formats)
    - 'analyze_all_patterns' (casing, whitespace, missing values)
    - 'detect_era_in_years' for any columns that look like they contain years
+   Emit ALL of these tool calls in a single response, as parallel function calls.
+   They are independent — do NOT wait for one result before calling the next.
 5. If 'detect_era_in_years' found eras, run 'extract_era_column' for those columns.
 6. Using ALL the results from steps 2-5, build a single list of SQL fix statements
    and run 'preview_full_plan' ONCE.
@@ -277,5 +279,7 @@ or approve the plan. Handle each type of request appropriately:
 - Example of WRONG SQL (never do this):
   UPDATE data SET quantity = NULL WHERE try_cast(quantity AS INTEGER) IS NULL;
 
-{DUCKDB_SQL_REFERENCE}
+{DUCKDB_SQL_RULES}
+For DuckDB syntax examples, call 'lookup_duckdb_reference' with one of these
+topics: {', '.join(DUCKDB_SQL_TOPICS)}.
 """
@@ -124,6 +124,10 @@ export async function streamAgentMessage(
   }
 
   let fullText = '';
+  // With streaming on, ADK sends the model's text as partial events and then
+  // repeats it in one aggregated final event. Text is taken from the partials
+  // and tool calls from the final event, so neither is shown twice.
+  let streamedText = false;
   const reader = res.body!.getReader();
   const decoder = new TextDecoder();
   let buffer = '';
@@ -146,7 +150,7 @@ export async function streamAgentMessage(
           const event = JSON.parse(jsonStr);
           if (event.content?.parts) {
             for (const part of event.content.parts) {
-              if (part.functionCall) {
+              if (part.functionCall && !event.partial) {
                 const name = part.functionCall.name;
                 callbacks.onToolCall(name, FRIENDLY_NAMES[name] || `Running ${name}`);
               }
@@ -156,12 +160,13 @@ export async function streamAgentMessage(
                   callbacks.onCleanedFile(cleanedFile);
                 }
               }
-              if (part.text) {
+              if (part.text && !part.thought && !(streamedText && !event.partial)) {
                 fullText += part.text;
                 callbacks.onToken(part.text);
               }
             }
           }
+          streamedText = Boolean(event.partial);
         } catch {
           // skip malformed events
         }